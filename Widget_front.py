@@ -9,23 +9,43 @@ Features:
 - Right-click menu + top toolbar for styling
 - Choose system fonts from dropdown; load a .ttf via "Font ▸ Load TTF"
 - Customize background / text / accent (caret) / border colors; border thickness
-Tested on Python 3.13 (Windows). No external packages required.
+Tested on Python 3.13 (Windows). No external packages required
+(orjson and msgpack are used for faster state I/O when installed).
 """
 
-import json, os, sys
+import json, os, sys, time
 import tkinter as tk
 from tkinter import ttk, colorchooser, filedialog, messagebox
 from tkinter import font as tkfont
 
+# optional fast JSON; both helpers work on bytes
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _loads(b):
+        return json.loads(b)
+
+# optional binary cache of the state for faster startup
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 APP_NAME = "Motivation Widget"
 STATE_FILE = "widget_state.json"
+FONT_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds before re-enumerating system fonts
 
 # ----------------------------
 # Utilities for state storage
 # ----------------------------
 def safe_int(x, default):
     try: return int(x)
-    except: return default
+    except (ValueError, TypeError): return default
 
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))
@@ -35,17 +55,85 @@ def ensure_state_file(path):
         with open(path, "w", encoding="utf-8") as f:
             json.dump({}, f)
 
+def geom_path(path):
+    # small sidecar holding only the window geometry, rewritten while dragging
+    return os.path.splitext(path)[0] + ".geom.json"
+
+def cache_path(path):
+    # binary copy of the state, only trusted while newer than the JSON
+    return os.path.splitext(path)[0] + ".cache.msgpack"
+
+def _read_cache(path):
+    cpath = cache_path(path)
+    if msgpack is None or not os.path.exists(cpath):
+        return None
+    if os.path.getmtime(cpath) < os.path.getmtime(path):
+        return None  # JSON was edited by hand after the cache was written
+    try:
+        with open(cpath, "rb") as f:
+            state = msgpack.unpackb(f.read())
+    except Exception:
+        return None
+    # a corrupt cache can still decode to a scalar; fall back to the JSON then
+    return state if isinstance(state, dict) else None
+
+def _read_json(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        return _loads(raw)
+    except ValueError:
+        return {}
+
 def load_state(path):
     ensure_state_file(path)
-    with open(path, "r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except:
-            return {}
-
-def save_state(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    state = _read_cache(path)
+    if state is None:
+        state = _read_json(path)
+    gpath = geom_path(path)
+    if isinstance(state, dict) and os.path.exists(gpath):
+        geom = _read_json(gpath)
+        if isinstance(geom, dict) and geom.get("geometry"):
+            state["geometry"] = geom["geometry"]
+    return state
+
+def _write_state(f, data, sections=None):
+    if sections is not None:
+        # write the top-level object piece by piece from cached section bytes,
+        # without joining them into one buffer; only sections missing from
+        # (or reset to None in) `sections` are re-encoded
+        f.write(b"{")
+        for i, (k, v) in enumerate(data.items()):
+            enc = sections.get(k)
+            if enc is None:
+                enc = sections[k] = _dumps(v)
+            if i:
+                f.write(b",")
+            f.write(_dumps(k))
+            f.write(b":")
+            f.write(enc)
+        f.write(b"}")
+    else:
+        f.write(_dumps(data))
+
+def save_state(path, data, sections=None):
+    # write to a temp file and swap it in, so a crash never leaves torn JSON
+    tmp = path + ".tmp"
+    with open(tmp, "wb", buffering=1 << 16) as f:
+        _write_state(f, data, sections)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def save_cache(path, data):
+    # only needed for the next startup, so written on close rather than per
+    # autosave; must follow the JSON save so its mtime marks it as current
+    if msgpack is None:
+        return
+    ctmp = cache_path(path) + ".tmp"
+    with open(ctmp, "wb") as f:
+        f.write(msgpack.packb(data))
+    os.replace(ctmp, cache_path(path))
 
 # ----------------------------
 # Default settings
@@ -81,7 +169,23 @@ class MotivationWidget:
         self.state = load_state(STATE_FILE)
         self._apply_defaults()
 
-        # outer border via root bg; inner frame uses background color
+        # autosave bookkeeping: pending after() job + which sections changed
+        self._save_job = None
+        self._geom_job = None
+        self._tags_dirty = False
+        self._text_dirty = False
+        self._geom_dirty = False
+        self._colors_dirty = False
+        self._last_saved_geom = self.state.get("geometry", "")
+        # encoded JSON per top-level state key; None means re-encode on next save
+        self._encoded_sections = {}
+
+        # style tags whose font/color is already configured on the text widget
+        self._configured_tags: set[str] = set()
+        # last color picked for selected text; pre-fills the chooser
+        self._last_color = None
+
+        # outer border via border_frame bg; inner frame uses background color
         self.root.config(bg=self.state["colors"]["border"])
         try:
             self.root.geometry(self.state["geometry"])
@@ -92,8 +196,11 @@ class MotivationWidget:
         self.root.attributes("-alpha", float(self.state["alpha"]))
 
         # ---- Layout
-        self.container = tk.Frame(self.root, bg=self.state["colors"]["background"], bd=self.state["border_thickness"])
-        self.container.pack(expand=True, fill="both")
+        bt = int(self.state.get("border_thickness", 2))
+        self.border_frame = tk.Frame(self.root, bg=self.state["colors"]["border"])
+        self.border_frame.pack(expand=True, fill="both")
+        self.container = tk.Frame(self.border_frame, bg=self.state["colors"]["background"], bd=self.state["border_thickness"])
+        self.container.pack(expand=True, fill="both", padx=bt, pady=bt)
 
         # Title bar (drag handle + controls)
         self.titlebar = tk.Frame(self.container, bg=self.state["colors"]["background"])
@@ -107,8 +214,18 @@ class MotivationWidget:
         self.toolbar = tk.Frame(self.container, bg=self.state["colors"]["background"])
         self.toolbar.pack(fill="x", padx=10, pady=(0, 6))
 
-        # Font family dropdown
-        self.font_families = sorted(set(tkfont.families()))
+        # Font family dropdown (enumerating system fonts is slow; use the cached list)
+        # (the state file is user-editable, so a malformed entry just forces a refresh)
+        cache = self.state.get("font_families_cache")
+        families = cache.get("families") if isinstance(cache, dict) else None
+        stamp = cache.get("timestamp") if isinstance(cache, dict) else None
+        if not isinstance(families, list) or not all(isinstance(f, str) for f in families):
+            families = []
+        if not isinstance(stamp, (int, float)) or isinstance(stamp, bool):
+            stamp = 0
+        self.font_families = list(families)
+        if not self.font_families or time.time() - stamp > FONT_CACHE_MAX_AGE:
+            self.root.after(200, self._refresh_font_list)
         self.base_font_var = tk.StringVar(value=self.state["base_font"]["family"])
         self.font_combo = ttk.Combobox(self.toolbar, values=self.font_families, textvariable=self.base_font_var, state="readonly", width=24)
         self.font_combo.pack(side="left", padx=(0, 6))
@@ -154,11 +271,10 @@ class MotivationWidget:
                                     variable=self.alpha_var, command=self.on_alpha_change, length=100)
         self.alpha_scale.pack(side="left", padx=(8, 2))
 
-        # Font menu
+        # Font menu (built on first click)
         self.font_menu_btn = tk.Menubutton(self.toolbar, text="Font ▾", relief="raised")
-        self.font_menu = tk.Menu(self.font_menu_btn, tearoff=0)
-        self.font_menu.add_command(label="Load TTF...", command=self.load_ttf)
-        self.font_menu_btn.config(menu=self.font_menu)
+        self.font_menu = None
+        self._font_menu_bind = self.font_menu_btn.bind("<Button-1>", self._build_font_menu)
         self.font_menu_btn.pack(side="left", padx=(6, 2))
 
         # Pin (always-on-top) toggle
@@ -167,7 +283,7 @@ class MotivationWidget:
         self.pin_btn.pack(side="left", padx=(8, 2))
 
         # Save button (manual save)
-        self.save_btn = tk.Button(self.toolbar, text="Save", command=self.save_all)
+        self.save_btn = tk.Button(self.toolbar, text="Save", command=self._do_save)
         self.save_btn.pack(side="left", padx=6)
 
         # Close button
@@ -199,12 +315,8 @@ class MotivationWidget:
         )
         self.text.pack(expand=True, fill="both")
 
-        # Right-click context menu
-        self.menu = tk.Menu(self.root, tearoff=0)
-        self.menu.add_command(label="Bold", command=self.apply_bold)
-        self.menu.add_command(label="Color…", command=self.apply_color)
-        self.menu.add_command(label="Increase Size", command=lambda: self.apply_size(delta=2))
-        self.menu.add_command(label="Decrease Size", command=lambda: self.apply_size(delta=-2))
+        # Right-click context menu (built on first use)
+        self.menu = None
         self.text.bind("<Button-3>", self._show_menu)
 
         # Dragging on titlebar
@@ -218,11 +330,17 @@ class MotivationWidget:
         self.resize_grip.bind("<Button-1>", self._start_resize)
         self.resize_grip.bind("<B1-Motion>", self._do_resize)
 
+        # bound configure methods of widgets painted with the theme colors
+        self._bg_setters = [w.configure for w in (self.container, self.titlebar, self.toolbar,
+                                                  self.title_label, self.close_btn, self.min_btn,
+                                                  self.resize_grip, self.text)]
+        self._fg_setter = self.text.configure
+
         # Load content + tags
         self._load_content()
 
-        # Autosave on typing / geometry changes
-        self.text.bind("<KeyRelease>", lambda e: self.save_all())
+        # Autosave on typing / geometry changes (debounced)
+        self.text.bind("<<Modified>>", self._on_modified)
         self.root.bind("<Configure>", self._on_configure)
 
         # Improve focus/selection
@@ -230,16 +348,18 @@ class MotivationWidget:
 
     # ---------- State helpers ----------
     def _apply_defaults(self):
-        # merge defaults with loaded state
-        def deep_merge(dst, src):
-            for k, v in src.items():
-                if isinstance(v, dict):
-                    dst[k] = deep_merge(dst.get(k, {}), v)
-                else:
-                    dst.setdefault(k, v)
-            return dst
-
-        self.state = deep_merge(self.state if isinstance(self.state, dict) else {}, DEFAULTS)
+        # merge defaults with loaded state (DEFAULTS is at most two levels deep)
+        s = self.state if isinstance(self.state, dict) else {}
+        for k, v in DEFAULTS.items():
+            if isinstance(v, dict):
+                if not isinstance(s.get(k), dict):
+                    s[k] = {}
+                for kk, vv in v.items():
+                    # copy nested defaults so state never aliases DEFAULTS
+                    s[k].setdefault(kk, vv.copy() if isinstance(vv, dict) else vv)
+            else:
+                s.setdefault(k, v)
+        self.state = s
 
     # ---------- Window movement ----------
     def _start_move(self, e):
@@ -266,7 +386,24 @@ class MotivationWidget:
         self.root.geometry(f"{w}x{h}")
 
     # ---------- Context menu ----------
+    def _ensure_menu(self):
+        if self.menu is None:
+            self.menu = tk.Menu(self.root, tearoff=0)
+            self.menu.add_command(label="Bold", command=self.apply_bold)
+            self.menu.add_command(label="Color…", command=self.apply_color)
+            self.menu.add_command(label="Increase Size", command=lambda: self.apply_size(delta=2))
+            self.menu.add_command(label="Decrease Size", command=lambda: self.apply_size(delta=-2))
+        return self.menu
+
+    def _build_font_menu(self, _evt=None):
+        # runs before the Menubutton class binding, which then posts the new menu
+        self.font_menu = tk.Menu(self.font_menu_btn, tearoff=0)
+        self.font_menu.add_command(label="Load TTF...", command=self.load_ttf)
+        self.font_menu_btn.config(menu=self.font_menu)
+        self.font_menu_btn.unbind("<Button-1>", self._font_menu_bind)
+
     def _show_menu(self, e):
+        self._ensure_menu()
         try:
             self.menu.tk_popup(e.x_root, e.y_root)
         finally:
@@ -284,72 +421,81 @@ class MotivationWidget:
     def apply_bold(self):
         start, end = self._get_selection()
         if not start: return
-        # make a bold font derived from current base font
-        b = tkfont.Font(self.text, self.text.cget("font"))
-        b.configure(weight="bold")
-        self.text.tag_configure("bold", font=b)
+        # make a bold font derived from current base font (once)
+        if "bold" not in self._configured_tags:
+            b = tkfont.Font(self.text, self.text.cget("font"))
+            b.configure(weight="bold")
+            self.text.tag_configure("bold", font=b)
+            self._configured_tags.add("bold")
         self.text.tag_add("bold", start, end)
-        self.save_all()
+        self._tags_dirty = True
+        self._schedule_save()
 
     def apply_size(self, delta=2):
         start, end = self._get_selection()
         if not start: return
-        base = tkfont.Font(self.text, self.text.cget("font"))
-        new_size = clamp(base.cget("size") + delta, 8, 96)
-        f = tkfont.Font(self.text, self.text.cget("font"))
-        f.configure(size=new_size)
+        new_size = clamp(self.base_font.cget("size") + delta, 8, 96)
         tag_name = f"size_{new_size}"
-        self.text.tag_configure(tag_name, font=f)
+        if tag_name not in self._configured_tags:
+            f = tkfont.Font(self.text, self.text.cget("font"))
+            f.configure(size=new_size)
+            self.text.tag_configure(tag_name, font=f)
+            self._configured_tags.add(tag_name)
         self.text.tag_add(tag_name, start, end)
-        self.save_all()
+        self._tags_dirty = True
+        self._schedule_save()
 
     def apply_color(self):
         start, end = self._get_selection()
         if not start: return
-        color = colorchooser.askcolor(title="Pick text color")[1]
+        color = colorchooser.askcolor(title="Pick text color", initialcolor=self._last_color)[1]
         if not color: return
+        self._last_color = color
         tag_name = f"color_{color}"
-        self.text.tag_configure(tag_name, foreground=color)
+        if tag_name not in self._configured_tags:
+            self.text.tag_configure(tag_name, foreground=color)
+            self._configured_tags.add(tag_name)
         self.text.tag_add(tag_name, start, end)
-        self.save_all()
+        self._tags_dirty = True
+        self._schedule_save()
 
     # ---------- Color / border / alpha ----------
     def pick_color(self, which):
-        color = colorchooser.askcolor(title=f"Pick {which} color")[1]
+        color = colorchooser.askcolor(title=f"Pick {which} color", initialcolor=self.state["colors"][which])[1]
         if not color: return
         self.state["colors"][which] = color
         if which == "background":
-            self.container.config(bg=color)
-            self.titlebar.config(bg=color)
-            self.toolbar.config(bg=color)
-            self.title_label.config(bg=color)
-            self.close_btn.config(bg=color)
-            self.min_btn.config(bg=color)
-            self.resize_grip.config(bg=color)
-            self.text.config(bg=color)
+            # redraws are coalesced into the next idle pass
+            for fn in self._bg_setters:
+                fn(bg=color)
         elif which == "text":
-            self.text.config(fg=color)
+            self._fg_setter(fg=color)
         elif which == "accent":
             self.text.config(insertbackground=color)
         elif which == "border":
             self.root.config(bg=color)
-        self.save_all()
+            self.border_frame.config(bg=color)
+        self._colors_dirty = True
+        self._schedule_save()
 
     def apply_border(self):
-        val = safe_int(self.border_var.get(), 2)
+        # IntVar.get() already returns an int; it raises TclError on junk input
+        try:
+            val = self.border_var.get()
+        except tk.TclError:
+            val = 2
         self.state["border_thickness"] = val
-        # simulate border using internal padding frame thickness
-        # (container already acts like inner panel; set its 'bd' via config doesn't show,
-        # so we rebuild pack to keep it simple)
-        self.container.pack_forget()
-        self.container.pack(expand=True, fill="both", padx=val, pady=val)
-        self.save_all()
+        # border_frame's bg shows through the container's padding
+        self.container.pack_configure(padx=val, pady=val)
+        self._colors_dirty = True
+        self._schedule_save()
 
     def on_alpha_change(self, _evt=None):
         a = float(self.alpha_var.get())
         self.state["alpha"] = a
         self.root.attributes("-alpha", a)
-        self.save_all()
+        self._colors_dirty = True
+        self._schedule_save()
 
     def toggle_pin(self):
         cur = bool(self.state["always_on_top"])
@@ -357,18 +503,31 @@ class MotivationWidget:
         self.state["always_on_top"] = new
         self.root.attributes("-topmost", new)
         self.pin_btn.config(text=("📌" if new else "📍"))
-        self.save_all()
+        self._colors_dirty = True
+        self._schedule_save()
 
     # ---------- Fonts ----------
     def on_base_font_change(self, _evt=None):
         fam = self.base_font_var.get()
-        size = safe_int(self.base_size_var.get(), 16)
-        size = clamp(size, 8, 96)
+        try:
+            size = clamp(self.base_size_var.get(), 8, 96)
+        except tk.TclError:
+            size = 16
         self.base_font.configure(family=fam, size=size)
         self.text.configure(font=self.base_font)
+        # bold/size tag fonts derive from the base family; rebuild them on next use
+        self._configured_tags = {t for t in self._configured_tags if t.startswith("color_")}
         self.state["base_font"]["family"] = fam
         self.state["base_font"]["size"] = size
-        self.save_all()
+        self._invalidate("base_font")
+        self._schedule_save()
+
+    def _refresh_font_list(self):
+        self.font_families = sorted(set(tkfont.families()))
+        self.font_combo["values"] = self.font_families
+        self.state["font_families_cache"] = {"families": list(self.font_families), "timestamp": time.time()}
+        self._invalidate("font_families_cache")
+        self._schedule_save()
 
     def load_ttf(self):
         path = filedialog.askopenfilename(
@@ -393,22 +552,27 @@ class MotivationWidget:
 
     # ---------- Minimize / Close ----------
     def on_minimize(self):
-        self.save_all()
+        self._do_save()
+        save_cache(STATE_FILE, self.state)
         self.root.withdraw()  # hide; relaunch script to show again
 
     def on_close(self):
-        self.save_all()
+        self._do_save()
+        save_cache(STATE_FILE, self.state)
         self.root.destroy()
 
     # ---------- Persist content + tags ----------
-    def _font_to_dict(self, f: tkfont.Font):
+    def _font_to_dict(self, font_name):
+        # one `font actual` round-trip instead of wrapping in tkfont.Font
+        flat = self.text.tk.splitlist(self.text.tk.call("font", "actual", font_name))
+        a = {flat[i][1:]: flat[i + 1] for i in range(0, len(flat), 2)}
         return {
-            "family": f.actual("family"),
-            "size":   f.actual("size"),
-            "weight": f.actual("weight"),
-            "slant":  f.actual("slant"),
-            "underline": int(f.actual("underline")),
-            "overstrike": int(f.actual("overstrike")),
+            "family": a["family"],
+            "size":   int(a["size"]),
+            "weight": a["weight"],
+            "slant":  a["slant"],
+            "underline": int(a["underline"]),
+            "overstrike": int(a["overstrike"]),
         }
 
     def _dict_to_font(self, d: dict):
@@ -426,24 +590,26 @@ class MotivationWidget:
         for tag in self.text.tag_names():
             if tag in ("sel",):
                 continue
+            tag_ranges = self.text.tag_ranges(tag)
+            # unused tags are only worth keeping if we configured them ourselves
+            if not tag_ranges and tag not in self._configured_tags:
+                continue
             cfg = {}
-            # capture font if set
-            try:
-                font_name = self.text.tag_cget(tag, "font")
-                if font_name:
-                    f = tkfont.Font(name=font_name, exists=True)
-                    cfg["font"] = self._font_to_dict(f)
-            except:
-                pass
-            # capture colors
-            fg = self.text.tag_cget(tag, "foreground")
-            bg = self.text.tag_cget(tag, "background")
+            # one `tag configure` call returns font + colors together
+            opts = self.text.tag_configure(tag)
+            font_name = str(opts["font"][-1])
+            if font_name:
+                try:
+                    cfg["font"] = self._font_to_dict(font_name)
+                except tk.TclError:
+                    pass
+            fg = str(opts["foreground"][-1])
+            bg = str(opts["background"][-1])
             if fg: cfg["foreground"] = fg
             if bg: cfg["background"] = bg
 
             # capture ranges
             ranges = []
-            tag_ranges = self.text.tag_ranges(tag)
             for i in range(0, len(tag_ranges), 2):
                 start = tag_ranges[i]
                 end   = tag_ranges[i+1]
@@ -464,53 +630,102 @@ class MotivationWidget:
                 self.text.tag_configure(tag, foreground=cfg["foreground"])
             if "background" in cfg:
                 self.text.tag_configure(tag, background=cfg["background"])
-            for start, end in data.get("ranges", []):
-                try:
-                    self.text.tag_add(tag, start, end)
-                except:
-                    pass
+            if cfg:
+                self._configured_tags.add(tag)
+            # `tag add` takes any number of ranges: one Tcl call per tag
+            ranges = data.get("ranges", [])
+            args = [idx for rng in ranges for idx in rng]
+            if not args:
+                continue
+            try:
+                self.text.tk.call(self.text._w, "tag", "add", tag, *args)
+            except tk.TclError:
+                # a bad index aborts the batch; redo range by range, skipping bad ones
+                for start, end in ranges:
+                    try:
+                        self.text.tag_add(tag, start, end)
+                    except:
+                        pass
+        self._tags_dirty = True
 
     def _load_content(self):
         content = self.state.get("content", {})
         self.text.delete("1.0", "end")
         self.text.insert("1.0", content.get("text", ""))
         self._apply_tags_from_state(content.get("tags", {}))
-        # apply container padding based on border thickness
-        bt = int(self.state.get("border_thickness", 2))
-        self.container.pack_forget()
-        self.container.pack(expand=True, fill="both", padx=bt, pady=bt)
-
-    def save_all(self):
-        # text + tags
-        self.state["content"]["text"] = self.text.get("1.0", "end-1c")
-        self.state["content"]["tags"] = self._capture_tags()
+        # loading isn't an edit; re-arm <<Modified>> for the first real change
+        self.text.edit_modified(False)
+
+    def _schedule_save(self, delay=500):
+        # coalesce bursts of edits / resizes into one write per idle window
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(delay, self._do_save)
+
+    def _invalidate(self, *keys):
+        for k in keys:
+            self._encoded_sections[k] = None
+
+    def _do_save(self):
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+        self._save_job = None
+        # text + tags (typing shifts tag ranges, so text edits recapture tags too)
+        if self._text_dirty:
+            self.state["content"]["text"] = self.text.get("1.0", "end-1c")
+        if self._text_dirty or self._tags_dirty:
+            self.state["content"]["tags"] = self._capture_tags()
+            self._invalidate("content")
         # colors and basic props
-        self.state["colors"]["background"] = self.container["bg"]
-        self.state["colors"]["text"] = self.text["fg"]
-        self.state["colors"]["accent"] = self.text["insertbackground"]
-        self.state["colors"]["border"] = self.root["bg"]
-        self.state["border_thickness"] = int(self.border_var.get())
-        self.state["alpha"] = float(self.alpha_var.get())
-        self.state["always_on_top"] = bool(self.root.attributes("-topmost"))
-        # base font
-        self.state["base_font"]["family"] = self.base_font.actual("family")
-        self.state["base_font"]["size"]   = self.base_font.actual("size")
-        self.state["base_font"]["weight"] = self.base_font.actual("weight")
-        self.state["base_font"]["slant"]  = self.base_font.actual("slant")
-        # geometry
+        if self._colors_dirty:
+            self.state["colors"]["background"] = self.container["bg"]
+            self.state["colors"]["text"] = self.text["fg"]
+            self.state["colors"]["accent"] = self.text["insertbackground"]
+            self.state["colors"]["border"] = self.border_frame["bg"]
+            self.state["alpha"] = float(self.alpha_var.get())
+            self.state["always_on_top"] = bool(self.root.attributes("-topmost"))
+            # border_thickness is already validated and stored by apply_border
+            self._invalidate("colors", "border_thickness", "alpha", "always_on_top")
+        # base font is written straight into state by on_base_font_change
+        # geometry (flush the sidecar too, since load_state prefers it)
+        if self._geom_dirty:
+            self._save_geom_only()
+        save_state(STATE_FILE, self.state, sections=self._encoded_sections)
+        self._tags_dirty = self._text_dirty = False
+        self._geom_dirty = self._colors_dirty = False
+
+    def _on_modified(self, _evt=None):
+        # <<Modified>> only fires when the flag flips, so clear it each time;
+        # clearing fires the event again, hence the check
+        if self.text.edit_modified():
+            self._text_dirty = True
+            self._schedule_save()
+            self.text.edit_modified(False)
+
+    def _save_geom_only(self):
+        if self._geom_job:
+            self.root.after_cancel(self._geom_job)
+        self._geom_job = None
         try:
             self.state["geometry"] = self.root.geometry()
         except:
-            pass
-        save_state(STATE_FILE, self.state)
+            return
+        # the sidecar is now current; the main file picks geometry up via the section cache
+        self._geom_dirty = False
+        self._invalidate("geometry")
+        save_state(geom_path(STATE_FILE), {"geometry": self.state["geometry"]})
 
     def _on_configure(self, _evt=None):
-        # save geometry changes (throttle is fine to omit for simplicity)
-        try:
-            self.state["geometry"] = self.root.geometry()
-            save_state(STATE_FILE, self.state)
-        except:
-            pass
+        # <Configure> also fires for focus changes and child widgets; skip no-ops
+        g = self.root.geometry()
+        if g == self._last_saved_geom:
+            return
+        self._last_saved_geom = g
+        # geometry goes to its own tiny file; the main document is left alone
+        self._geom_dirty = True
+        if self._geom_job:
+            self.root.after_cancel(self._geom_job)
+        self._geom_job = self.root.after(200, self._save_geom_only)
 
 
 def main():